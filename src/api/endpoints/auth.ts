@@ -23,15 +23,19 @@ export interface AuthResponse {
 export const authApi = {
   async login(credentials: LoginRequest): Promise<AuthResponse> {
     const response = await apiClient.post<AuthResponse>('/auth/login', credentials);
-    await storage.setAuthTokens(response.tokens);
-    await storage.setUserId(response.user.id);
+    await Promise.all([
+      storage.setAuthTokens(response.tokens),
+      storage.setUserId(response.user.id),
+    ]);
     return response;
   },
 
   async register(data: RegisterRequest): Promise<AuthResponse> {
     const response = await apiClient.post<AuthResponse>('/auth/register', data);
-    await storage.setAuthTokens(response.tokens);
-    await storage.setUserId(response.user.id);
+    await Promise.all([
+      storage.setAuthTokens(response.tokens),
+      storage.setUserId(response.user.id),
+    ]);
     return response;
   },
 
@@ -3,6 +3,7 @@
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query';
 import { dietApi, LogDietItemRequest } from '../endpoints/diet';
 import { format } from 'date-fns';
+import { DietPlan } from '../../types';
 
 export const useTodayDiet = (date: Date) => {
   const dateStr = format(date, 'yyyy-MM-dd');
@@ -61,8 +62,11 @@ export const useCreateDietPlan = () => {
   
   return useMutation({
     mutationFn: dietApi.createPlan,
-    onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ['diet', 'plans'] });
+    onSuccess: (plan) => {
+      // The response is the full plan, so append it instead of refetching the list
+      queryClient.setQueryData<DietPlan[]>(['diet', 'plans'], (plans) =>
+        plans ? [...plans, plan] : plans
+      );
     },
   });
 };
@@ -73,8 +77,14 @@ export const useUpdateDietPlan = () => {
   return useMutation({
     mutationFn: ({ planId, data }: { planId: string; data: any }) =>
       dietApi.updatePlan(planId, data),
-    onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ['diet', 'plans'] });
+    onSuccess: (plan) => {
+      queryClient.setQueryData<DietPlan[]>(['diet', 'plans'], (plans) =>
+        plans?.map((existing) => {
+          if (existing.id === plan.id) return plan;
+          // Only one plan can be current; mirror the server unsetting the others
+          return plan.isCurrent && existing.isCurrent ? { ...existing, isCurrent: false } : existing;
+        })
+      );
     },
   });
 };
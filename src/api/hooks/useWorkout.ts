@@ -19,7 +19,9 @@ export const useCreateWorkoutSession = () => {
   
   return useMutation({
     mutationFn: (data: CreateWorkoutSessionRequest) => workoutApi.createSession(data),
-    onSuccess: (_, variables) => {
+    onSuccess: (session, variables) => {
+      // Seed the detail query so opening the new session needs no extra request
+      queryClient.setQueryData(['workout', 'session', session.id], session);
       queryClient.invalidateQueries({ queryKey: ['workout', 'today', variables.date] });
       queryClient.invalidateQueries({ queryKey: ['workout', 'sessions'] });
     },
@@ -8,6 +8,7 @@ import { useForm, Controller } from 'react-hook-form';
 import { Input, Button } from '../../../components';
 import { colors, spacing, typography, textStyles } from '../../../theme';
 import { useRegister } from '../../../api/hooks';
+import { EMAIL_PATTERN } from '../../../utils/validation';
 import { useAuthStore } from '../../../store/authStore';
 import { AuthStackParamList } from '../../../navigation/types';
 
@@ -55,7 +56,7 @@ export const RegisterScreen: React.FC = () => {
           rules={{
             required: 'Email is required',
             pattern: {
-              value: /^[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}$/i,
+              value: EMAIL_PATTERN,
               message: 'Invalid email address',
             },
           }}
@@ -37,11 +37,6 @@ export const DietAdherenceGraphScreen: React.FC = () => {
     y: item.calories,
   }));
 
-  const chartDataProtein = adherenceData.map((item: any) => ({
-    x: new Date(item.date),
-    y: item.protein,
-  }));
-
   return (
     <ScrollView style={styles.container} contentContainerStyle={styles.content}>
       {/* Weekly calendar */}
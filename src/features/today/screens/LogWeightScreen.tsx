@@ -8,6 +8,7 @@ import { format } from 'date-fns';
 import { Input, Button } from '../../../components';
 import { colors, spacing } from '../../../theme';
 import { useLogWeight } from '../../../api/hooks';
+import { DECIMAL_NUMBER_PATTERN } from '../../../utils/validation';
 
 interface FormData {
   weight: string;
@@ -43,7 +44,7 @@ export const LogWeightScreen: React.FC = () => {
           rules={{
             required: 'Weight is required',
             pattern: {
-              value: /^\d+(\.\d+)?$/,
+              value: DECIMAL_NUMBER_PATTERN,
               message: 'Please enter a valid number',
             },
           }}
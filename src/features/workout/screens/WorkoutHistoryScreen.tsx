@@ -42,7 +42,8 @@ export const WorkoutHistoryScreen: React.FC = () => {
   );
 
   const groupedSessions = sessions?.reduce((acc, session) => {
-    const dateKey = format(new Date(session.date), 'yyyy-MM-dd');
+    // session.date is already a YYYY-MM-DD string, so it can be used as the key directly
+    const dateKey = session.date;
     if (!acc[dateKey]) {
       acc[dateKey] = [];
     }
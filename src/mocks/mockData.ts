@@ -97,6 +97,8 @@ const foodItems: FoodItem[] = [
   },
 ];
 
+const foodItemsById = new Map(foodItems.map((food) => [food.id, food]));
+
 const cloneMeal = (meal: DietMeal, date: string): DietMeal => ({
   ...meal,
   items: meal.items.map((item) => ({
@@ -106,46 +108,45 @@ const cloneMeal = (meal: DietMeal, date: string): DietMeal => ({
   })),
 });
 
-const calculateTotals = (meals: DietMeal[], adHocItems: DietItem[]): { planned: MacroTotals; actual: MacroTotals } => {
-  const totals: { planned: MacroTotals; actual: MacroTotals } = {
-    planned: { calories: 0, protein: 0, carbs: 0, fat: 0 },
-    actual: { calories: 0, protein: 0, carbs: 0, fat: 0 },
-  };
+const emptyMacros = (): MacroTotals => ({ calories: 0, protein: 0, carbs: 0, fat: 0 });
 
-  const accumulate = (item: DietItem, target: 'planned' | 'actual') => {
-    const food = item.food;
-    const grams =
-      target === 'planned'
-        ? item.plannedQuantity
-        : item.actualQuantity ?? (item.isEaten ? item.plannedQuantity : 0);
-    const factor = grams / 100;
-    totals[target].calories += food.calories * factor;
-    totals[target].protein += food.protein * factor;
-    totals[target].carbs += food.carbs * factor;
-    totals[target].fat += food.fat * factor;
-  };
+const addMacros = (target: MacroTotals, food: FoodItem, grams: number) => {
+  if (grams === 0) return;
+  const factor = grams / 100;
+  target.calories += food.calories * factor;
+  target.protein += food.protein * factor;
+  target.carbs += food.carbs * factor;
+  target.fat += food.fat * factor;
+};
 
-  meals.forEach((meal) => {
-    meal.items.forEach((item) => {
-      accumulate(item, 'planned');
-      accumulate(item, 'actual');
-    });
-  });
+const eatenQuantity = (item: DietItem): number =>
+  item.actualQuantity ?? (item.isEaten ? item.plannedQuantity : 0);
 
-  adHocItems.forEach((item) => {
-    accumulate(item, 'actual');
-  });
+const roundTotals = (macro: MacroTotals): MacroTotals => ({
+  calories: Math.round(macro.calories),
+  protein: Math.round(macro.protein),
+  carbs: Math.round(macro.carbs),
+  fat: Math.round(macro.fat),
+});
 
-  const roundTotals = (macro: MacroTotals): MacroTotals => ({
-    calories: Math.round(macro.calories),
-    protein: Math.round(macro.protein),
-    carbs: Math.round(macro.carbs),
-    fat: Math.round(macro.fat),
-  });
+const calculateTotals = (meals: DietMeal[], adHocItems: DietItem[]): { planned: MacroTotals; actual: MacroTotals } => {
+  const planned = emptyMacros();
+  const actual = emptyMacros();
+
+  for (const meal of meals) {
+    for (const item of meal.items) {
+      addMacros(planned, item.food, item.plannedQuantity);
+      addMacros(actual, item.food, eatenQuantity(item));
+    }
+  }
+
+  for (const item of adHocItems) {
+    addMacros(actual, item.food, eatenQuantity(item));
+  }
 
   return {
-    planned: roundTotals(totals.planned),
-    actual: roundTotals(totals.actual),
+    planned: roundTotals(planned),
+    actual: roundTotals(actual),
   };
 };
 
@@ -154,7 +155,7 @@ const createMeal = (name: string, time: string, entries: Array<{ foodId: string;
   name,
   time,
   items: entries.map((entry) => {
-    const food = foodItems.find((f) => f.id === entry.foodId)!;
+    const food = foodItemsById.get(entry.foodId)!;
     return {
       id: uuidv4(),
       foodId: food.id,
@@ -229,6 +230,8 @@ const exercises: Exercise[] = [
   { id: 'ex_run', name: 'Easy Run', category: 'cardio', muscleGroup: ['full_body'] },
 ];
 
+const exercisesById = new Map(exercises.map((exercise) => [exercise.id, exercise]));
+
 const createSet = (weight: number, reps: number, completed = true): WorkoutSet => ({
   id: uuidv4(),
   weight,
@@ -236,6 +239,20 @@ const createSet = (weight: number, reps: number, completed = true): WorkoutSet =
   completed,
 });
 
+export const calculateSessionTotals = (
+  exercises: Array<{ sets: Array<{ weight?: number; reps?: number }> }>
+): { totalSets: number; totalVolume: number } => {
+  let totalSets = 0;
+  let totalVolume = 0;
+  for (const exercise of exercises) {
+    for (const set of exercise.sets) {
+      totalSets += 1;
+      totalVolume += (set.weight ?? 0) * (set.reps ?? 0);
+    }
+  }
+  return { totalSets, totalVolume };
+};
+
 const workoutToday: Workout = {
   id: 'workout_push',
   name: 'Upper Body Push',
@@ -273,13 +290,6 @@ const buildWorkoutSession = (daysAgo: number): WorkoutSession => {
     sets: exercise.sets.map((set) => ({ ...set, id: uuidv4() })),
   }));
 
-  const totalVolume = exercisesCompleted.reduce(
-    (sum, exercise) =>
-      sum +
-      exercise.sets.reduce((setSum, set) => setSum + set.weight * set.reps, 0),
-    0
-  );
-
   return {
     id: uuidv4(),
     userId: 'user_1',
@@ -291,8 +301,7 @@ const buildWorkoutSession = (daysAgo: number): WorkoutSession => {
     endTime: '19:00',
     exercises: exercisesCompleted,
     totals: {
-      totalSets: exercisesCompleted.reduce((sum, ex) => sum + ex.sets.length, 0),
-      totalVolume,
+      ...calculateSessionTotals(exercisesCompleted),
       duration: 60,
     },
     isSynced: true,
@@ -430,6 +439,10 @@ export const recalculateDietDayTotals = (date: string): void => {
       : 100;
 };
 
+export const findFoodItem = (foodId: string): FoodItem | undefined => foodItemsById.get(foodId);
+
+export const findExercise = (exerciseId: string): Exercise | undefined => exercisesById.get(exerciseId);
+
 export const ensureWorkoutSession = (sessionId: string): WorkoutSession | undefined =>
   mockDb.workoutSessions.find((session) => session.id === sessionId);
 
@@ -6,6 +6,9 @@ import {
   getDietDayForDate,
   recalculateDietDayTotals,
   ensureWorkoutSession,
+  findFoodItem,
+  findExercise,
+  calculateSessionTotals,
 } from './mockData';
 import {
   DietDay,
@@ -89,7 +92,7 @@ export const setupMockApi = (client: AxiosInstance): void => {
     const body = parseBody(config.data);
     const date = body.date || todayStr();
     const day = getDietDayForDate(date);
-    const food = mockDb.foodItems.find((item) => item.id === body.foodId) ?? mockDb.foodItems[0];
+    const food = findFoodItem(body.foodId) ?? mockDb.foodItems[0];
     const adHocItem = {
       id: uuidv4(),
       foodId: food.id,
@@ -163,6 +166,11 @@ export const setupMockApi = (client: AxiosInstance): void => {
     if (!match) return [404];
     const plan = mockDb.dietPlans.find((p) => p.id === match[1]);
     if (!plan) return [404];
+    if (body.isCurrent === true) {
+      mockDb.dietPlans.forEach((other) => {
+        if (other !== plan) other.isCurrent = false;
+      });
+    }
     Object.assign(plan, body, { updatedAt: new Date().toISOString() });
     return [200, plan];
   });
@@ -185,6 +193,17 @@ export const setupMockApi = (client: AxiosInstance): void => {
   mock.onPost('/workout/sessions').reply((config) => {
     const body = parseBody(config.data);
     const date = body.date || todayStr();
+    const exercises: WorkoutSession['exercises'] = (body.exercises ?? []).map((ex: any) => ({
+      id: uuidv4(),
+      exerciseId: ex.exerciseId,
+      exercise: findExercise(ex.exerciseId) ?? mockDb.exercises[0],
+      sets: (ex.sets ?? []).map((set: any) => ({
+        id: uuidv4(),
+        weight: set.weight ?? 0,
+        reps: set.reps ?? 0,
+        completed: true,
+      })),
+    }));
     const created: WorkoutSession = {
       id: uuidv4(),
       userId: mockDb.user.id,
@@ -194,25 +213,9 @@ export const setupMockApi = (client: AxiosInstance): void => {
       date,
       startTime: body.startTime ?? '18:00',
       endTime: body.endTime ?? '19:00',
-      exercises: (body.exercises ?? []).map((ex: any) => ({
-        id: uuidv4(),
-        exerciseId: ex.exerciseId,
-        exercise: mockDb.exercises.find((exercise) => exercise.id === ex.exerciseId) ?? mockDb.exercises[0],
-        sets: (ex.sets ?? []).map((set: any) => ({
-          id: uuidv4(),
-          weight: set.weight ?? 0,
-          reps: set.reps ?? 0,
-          completed: true,
-        })),
-      })),
+      exercises,
       totals: {
-        totalSets: body.exercises?.reduce((sum: number, ex: any) => sum + (ex.sets?.length ?? 0), 0) ?? 0,
-        totalVolume:
-          body.exercises?.reduce(
-            (sum: number, ex: any) =>
-              sum + (ex.sets ?? []).reduce((setSum: number, set: any) => setSum + (set.weight ?? 0) * (set.reps ?? 0), 0),
-            0
-          ) ?? 0,
+        ...calculateSessionTotals(exercises),
         duration: 60,
       },
       isSynced: true,
@@ -283,11 +286,19 @@ export const setupMockApi = (client: AxiosInstance): void => {
 
   mock.onPost('/progress/weight').reply((config) => {
     const body = parseBody(config.data);
+    const date = body.date || todayStr();
+    const weight = body.weight ?? 80;
+    // One metric per day, like the server's upsert
+    const existing = mockDb.weightEntries.find((item) => item.date === date);
+    if (existing) {
+      existing.weight = weight;
+      return [200, existing];
+    }
     const entry: BodyMetric = {
       id: uuidv4(),
       userId: mockDb.user.id,
-      date: body.date || todayStr(),
-      weight: body.weight ?? 80,
+      date,
+      weight,
       createdAt: new Date().toISOString(),
     };
     mockDb.weightEntries.push(entry);
@@ -48,45 +48,41 @@ class OfflineQueueService {
     }
 
     const queue = await this.getQueue();
-    let workingQueue: OfflineQueueItem[] = [...queue];
+    // Build the remaining queue in one pass instead of re-filtering it per item
+    const remainingQueue: OfflineQueueItem[] = [];
     let synced = 0;
     let failed = 0;
-    let queueChanged = false;
 
     for (const item of queue) {
-      if (item.type === 'workout_session') {
-        try {
-          await workoutApi.createSession(item.data as CreateWorkoutSessionRequest);
-          workingQueue = workingQueue.filter((q) => q.id !== item.id);
-          queueChanged = true;
-          synced++;
-        } catch (error) {
-          // Increment retry count
-          item.retries = (item.retries || 0) + 1;
-          failed++;
+      if (item.type !== 'workout_session') {
+        remainingQueue.push(item);
+        continue;
+      }
+
+      try {
+        await workoutApi.createSession(item.data as CreateWorkoutSessionRequest);
+        synced++;
+      } catch (error) {
+        // Increment retry count
+        const retries = (item.retries || 0) + 1;
+        failed++;
 
-          // Remove if too many retries and log warning
-          if (item.retries >= 3) {
-            console.warn(
-              `Failed to sync workout session after 3 attempts. Item ID: ${item.id}`,
-              error
-            );
-            // TODO: Consider persisting failed items in a separate storage for manual recovery
-            workingQueue = workingQueue.filter((q) => q.id !== item.id);
-          } else {
-            const itemIndex = workingQueue.findIndex((q) => q.id === item.id);
-            if (itemIndex !== -1) {
-              workingQueue[itemIndex] = { ...item };
-            }
-          }
-          queueChanged = true;
+        // Remove if too many retries and log warning
+        if (retries >= 3) {
+          console.warn(
+            `Failed to sync workout session after 3 attempts. Item ID: ${item.id}`,
+            error
+          );
+          // TODO: Consider persisting failed items in a separate storage for manual recovery
+        } else {
+          remainingQueue.push({ ...item, retries });
         }
       }
     }
 
-    if (queueChanged) {
-      await storage.setOfflineQueue(workingQueue);
-      useOfflineStore.setState({ pendingSyncCount: workingQueue.length });
+    if (synced > 0 || failed > 0) {
+      await storage.setOfflineQueue(remainingQueue);
+      useOfflineStore.setState({ pendingSyncCount: remainingQueue.length });
     }
 
     return { synced, failed };
@@ -15,25 +15,39 @@ export function calculate1RM(weight: number, reps: number): number {
  * Calculate total volume for sets
  */
 export function calculateTotalVolume(sets: WorkoutSet[]): number {
-  return sets
-    .filter(set => set.completed)
-    .reduce((total, set) => total + set.weight * set.reps, 0);
+  let total = 0;
+  for (const set of sets) {
+    if (set.completed) {
+      total += set.weight * set.reps;
+    }
+  }
+  return total;
 }
 
+const MACRO_KEYS: Array<keyof MacroTotals> = ['calories', 'protein', 'carbs', 'fat'];
+
 /**
  * Calculate diet adherence percentage
+ * Macros without a planned target are ignored; with no targets at all adherence is 100%.
  */
 export function calculateDietAdherence(
   actual: MacroTotals,
   planned: MacroTotals
 ): number {
-  const calorieDeviation = Math.abs((actual.calories - planned.calories) / planned.calories);
-  const proteinDeviation = Math.abs((actual.protein - planned.protein) / planned.protein);
-  const carbsDeviation = Math.abs((actual.carbs - planned.carbs) / planned.carbs);
-  const fatDeviation = Math.abs((actual.fat - planned.fat) / planned.fat);
+  let totalDeviation = 0;
+  let targetCount = 0;
+  for (const key of MACRO_KEYS) {
+    const target = planned[key];
+    if (target > 0) {
+      totalDeviation += Math.abs((actual[key] - target) / target);
+      targetCount += 1;
+    }
+  }
+
+  if (targetCount === 0) return 100;
+
+  const avgDeviation = totalDeviation / targetCount;
 
-  const avgDeviation = (calorieDeviation + proteinDeviation + carbsDeviation + fatDeviation) / 4;
-  
   // Convert deviation to adherence (100% = perfect match)
   const adherence = Math.max(0, Math.min(100, (1 - avgDeviation) * 100));
   return Math.round(adherence);
@@ -22,13 +22,26 @@ const secureStoreAvailable =
 // SecureStore is only safe to use in release builds right now (Expo Go/Hermes throws native errors)
 const shouldUseSecureStore = secureStoreAvailable && !__DEV__;
 
+type StoredAuthTokens = { accessToken: string; refreshToken: string };
+
+// In-memory copy of the persisted tokens so the request interceptor does not
+// hit SecureStore/AsyncStorage and re-parse JSON on every API call.
+// `undefined` means "not loaded yet"; `null` means "no tokens stored".
+let cachedAuthTokens: StoredAuthTokens | null | undefined;
+
 export const storage = {
   // Auth - Using SecureStore for sensitive data
-  async getAuthTokens(): Promise<{ accessToken: string; refreshToken: string } | null> {
+  async getAuthTokens(): Promise<StoredAuthTokens | null> {
+    if (cachedAuthTokens !== undefined) {
+      return cachedAuthTokens;
+    }
+
     if (shouldUseSecureStore) {
       try {
         const data = await SecureStore.getItemAsync(STORAGE_KEYS.AUTH_TOKENS);
-        return data ? JSON.parse(data) : null;
+        const tokens: StoredAuthTokens | null = data ? JSON.parse(data) : null;
+        cachedAuthTokens = tokens;
+        return tokens;
       } catch (error) {
         console.error('Error getting auth tokens from SecureStore:', error);
         // Fall through to the dev fallback
@@ -37,17 +50,20 @@ export const storage = {
 
     try {
       const data = await AsyncStorage.getItem(FALLBACK_KEYS.AUTH_TOKENS);
-      return data ? JSON.parse(data) : null;
+      const tokens: StoredAuthTokens | null = data ? JSON.parse(data) : null;
+      cachedAuthTokens = tokens;
+      return tokens;
     } catch (error) {
       console.error('Error getting fallback auth tokens:', error);
       return null;
     }
   },
 
-  async setAuthTokens(tokens: { accessToken: string; refreshToken: string }): Promise<void> {
+  async setAuthTokens(tokens: StoredAuthTokens): Promise<void> {
     if (shouldUseSecureStore) {
       try {
         await SecureStore.setItemAsync(STORAGE_KEYS.AUTH_TOKENS, JSON.stringify(tokens));
+        cachedAuthTokens = tokens;
         return;
       } catch (error) {
         console.error('Error setting auth tokens in SecureStore:', error);
@@ -57,6 +73,7 @@ export const storage = {
 
     try {
       await AsyncStorage.setItem(FALLBACK_KEYS.AUTH_TOKENS, JSON.stringify(tokens));
+      cachedAuthTokens = tokens;
     } catch (error) {
       console.error('Error setting fallback auth tokens:', error);
       throw error;
@@ -64,18 +81,21 @@ export const storage = {
   },
 
   async clearAuthTokens(): Promise<void> {
+    cachedAuthTokens = null;
+
     if (shouldUseSecureStore) {
       try {
-        await SecureStore.deleteItemAsync(STORAGE_KEYS.AUTH_TOKENS);
-        await SecureStore.deleteItemAsync(STORAGE_KEYS.USER_ID);
+        await Promise.all([
+          SecureStore.deleteItemAsync(STORAGE_KEYS.AUTH_TOKENS),
+          SecureStore.deleteItemAsync(STORAGE_KEYS.USER_ID),
+        ]);
       } catch (error) {
         console.error('Error clearing auth tokens from SecureStore:', error);
       }
     }
 
     try {
-      await AsyncStorage.removeItem(FALLBACK_KEYS.AUTH_TOKENS);
-      await AsyncStorage.removeItem(FALLBACK_KEYS.USER_ID);
+      await AsyncStorage.multiRemove([FALLBACK_KEYS.AUTH_TOKENS, FALLBACK_KEYS.USER_ID]);
     } catch (error) {
       console.error('Error clearing fallback auth tokens:', error);
     }
@@ -0,0 +1,9 @@
+// File: src/utils/validation.ts
+
+/**
+ * Shared form validation patterns, compiled once at module load instead of
+ * being re-created on every render of the screens that use them.
+ */
+export const EMAIL_PATTERN = /^[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}$/i;
+
+export const DECIMAL_NUMBER_PATTERN = /^\d+(\.\d+)?$/;